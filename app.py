@@ -4,10 +4,15 @@ import datetime
 import random
 import requests
 import pandas as pd
+import numpy as np
 from dotenv import load_dotenv
 import logging
-from collections import defaultdict
 import io
+import importlib.util
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
 import folium
 from folium.plugins import Geocoder
 
@@ -17,29 +22,69 @@ except ImportError:
      st.error("Required libraries `folium` and `streamlit-folium` not found. Install: `pip install folium streamlit-folium`")
      st.stop()
 
+# langchain_google_genai and gTTS are slow to import, so only check they are installed here; they are imported on first use.
 try:
-    from langchain_google_genai import ChatGoogleGenerativeAI
     from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-    LANGCHAIN_AVAILABLE = True
+    LANGCHAIN_AVAILABLE = importlib.util.find_spec("langchain_google_genai") is not None
 except ImportError:
-    st.error("Required library `langchain-google-genai` not found. Install: `pip install langchain-google-genai pandas streamlit-folium folium python-dotenv requests gTTS`")
     LANGCHAIN_AVAILABLE = False
+if not LANGCHAIN_AVAILABLE:
+    st.error("Required library `langchain-google-genai` not found. Install: `pip install langchain-google-genai pandas streamlit-folium folium python-dotenv requests gTTS`")
     st.stop()
 
 try:
-    from gtts import gTTS
-    GTTS_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
+    ORJSON_AVAILABLE = False
+
+GTTS_AVAILABLE = importlib.util.find_spec("gtts") is not None
+if not GTTS_AVAILABLE:
     st.error("Required library `gTTS` not found for audio playback. Install: `pip install gTTS`")
-    GTTS_AVAILABLE = False
 
 
 load_dotenv()
 log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
-logging.basicConfig(level=log_level, format='%(asctime)s - %(levelname)s - %(name)s - %(message)s')
+logging.basicConfig(level=log_level, format='%(asctime)s - %(levelname)s - %(name)s - %(message)s', datefmt='%Y-%m-%dT%H:%M:%S')
 logger = logging.getLogger(__name__)
 
 WEATHER_API_URL = "http://api.openweathermap.org/data/2.5/forecast"
+WEATHER_CACHE_TTL_SECONDS = 600
+WEATHER_CACHE_MAX_ENTRIES = 4096
+WEATHER_PREFETCH_WORKERS = 4
+WEATHER_PREFETCH_MIN_INTERVAL_SECONDS = 1.0
+WEATHER_PREFETCH_RETRY_SECONDS = 300
+HTTP_POOL_MAXSIZE = 20
+RAIN_ALERT_HEAVY_MM = 7
+RAIN_ALERT_MODERATE_MM = 2
+TEMP_ALERT_VERY_HIGH_C = 40
+TEMP_ALERT_HIGH_C = 37
+TEMP_ALERT_LOW_C = 8
+WIND_ALERT_VERY_STRONG_MS = 17
+WIND_ALERT_STRONG_MS = 12
+RAIN_ALERT_LABELS = (None, "Moderate rain ({value:.1f}mm/3hr)", "Heavy rain ({value:.1f}mm/3hr)")
+TEMP_ALERT_LABELS = (None, "Low Temp ({value:.0f}°C)", "High Temp ({value:.0f}°C)", "Very High Temp ({value:.0f}°C)")
+WIND_ALERT_LABELS = (None, "Strong Wind ({value:.0f} km/h)", "Very Strong Wind ({value:.0f} km/h)")
+CROP_INTENT_KEYWORDS = ("crop recommend", "suggest crop", "kya ugana", "फसल सुझा", "பயிர்களைப் பரிந்துரை", "ফসল সুপারিশ", "పంటలను సూచిం", "पिके सुचवा", "grow next", "suitable crop", "कौन सी फसल", "எந்தப் பயிர்", "plant next")
+MARKET_INTENT_KEYWORDS = ("market price", "mandi rate", "bazaar price", "बाजार भाव", "சந்தை விலை", "বাজার দর", "మార్కెట్ ధర", "what price", "selling price", "bhav", "kimat")
+WEATHER_INTENT_KEYWORDS = ("weather", "forecast", "mausam", "मौसम", "வானிலை", "আবহাওয়া", "వాతావరణం", "हवामान", "rain", "temperature", "barish", "tapman", "humidity", "wind")
+HEALTH_INTENT_KEYWORDS = ("disease", "pest", "infection", "sick plant", "plant health", "रोग", "कीट", "நோய்", "রোগ", "తెగులు", "कीड", "problem with plant", "issue with crop")
+# Checked in order; the first crop with a matching keyword wins, otherwise Wheat.
+MARKET_CROP_KEYWORDS = (
+    ("Rice", ("rice", "chawal", "धान", "चावल", "அரிசி", "চাল", "బియ్యం", "तांदूळ")),
+    ("Maize", ("maize", "makka", "मक्का", "சோளம்", "ভুট্টা", "మొక్కజొన్న", "मका")),
+    ("Cotton", ("cotton", "kapas", "कपास", "பருத்தி", "তুলা", "పత్తి", "कापूस")),
+    ("Tomato", ("tomato", "tamatar", "टमाटर", "தக்காளி", "টমেটো", "టమోటా", "टोमॅटो"))
+)
+MARKET_BASE_PRICES = {"Wheat": 2100, "Rice": 2800, "Maize": 1900, "Cotton": 6200, "Tomato": 1200, "Default": 2300}
+RESPONSE_ERROR_INDICATORS = (
+    "error:", "sorry, i cannot", "warning:", "could not process", "internal error", "invalid api key",
+    "exception:", "blocked by content", "filter", "unable to", "failed to", "api key validation failed"
+)
+RESPONSE_ERROR_KEYS = ("gemini_key_error", "processing_error", "llm_init_error", "system_error_label", "weather_data_error", "weather_error_", "tts_error_")
+FORECAST_SUMMARY_DAYS = 5
+UNIX_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+WEEKDAY_ABBREVIATIONS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
 FARMER_CSV_PATH = "Data.csv"
 QA_LOG_PATH = "Log.csv"
 CSV_COLUMNS = ['name', 'language', 'latitude', 'longitude', 'soil_type', 'farm_size_ha']
@@ -524,7 +569,7 @@ def _format_translation(template, **kwargs):
         formatted = formatted.replace('<DOUBLE_BRACE_OPEN>', '{{').replace('<DOUBLE_BRACE_CLOSE>', '}}')
         return formatted
     except KeyError as e:
-        logger.warning(f"Translator: Missing format key '{e}' in template. Template: '{template}' Kwargs: {kwargs}")
+        logger.warning("Translator: Missing format key '%s' in template. Template: '%s' Kwargs: %s", e, template, kwargs)
         return template
     except ValueError as e:
         key_causing_error = None
@@ -533,13 +578,13 @@ def _format_translation(template, **kwargs):
                 key_causing_error = key_check
                 break
         if "Unknown format code" in str(e):
-             logger.warning(f"Translator: Formatting error for key '{key_causing_error or 'unknown'}'. Value type: {type(kwargs.get(key_causing_error))}. Template: '{template}'")
+             logger.warning("Translator: Formatting error for key '%s'. Value type: %s. Template: '%s'", key_causing_error or 'unknown', type(kwargs.get(key_causing_error)), template)
              return template
         else:
-            logger.error(f"Translator: Unexpected format value error with args {formatted_kwargs}: {e}. Template: '{template}'", exc_info=False)
+            logger.error("Translator: Unexpected format value error with args %s: %s. Template: '%s'", formatted_kwargs, e, template, exc_info=False)
             return template
     except Exception as e:
-        logger.error(f"Translator: Unexpected format error with args {formatted_kwargs}: {e}. Template: '{template}'", exc_info=False)
+        logger.error("Translator: Unexpected format error with args %s: %s. Template: '%s'", formatted_kwargs, e, template, exc_info=False)
         return template
 
 def ui_translator(key, default=None, **kwargs):
@@ -547,7 +592,7 @@ def ui_translator(key, default=None, **kwargs):
 
     if selected_language not in translations:
         if selected_language != "English":
-            logger.warning(f"Selected language '{selected_language}' not found in translations. Falling back to English.")
+            logger.warning("Selected language '%s' not found in translations. Falling back to English.", selected_language)
             selected_language = "English"
             st.session_state.selected_language = "English"
 
@@ -559,7 +604,7 @@ def ui_translator(key, default=None, **kwargs):
         template = default_lang_dict.get(key)
         if template is None:
             missing_key_msg = f"[{key} NOT FOUND in {selected_language} or English]"
-            logger.debug(f"Translation key '{key}' not found for language '{selected_language}' or fallback 'English'.")
+            logger.debug("Translation key '%s' not found for language '%s' or fallback 'English'.", key, selected_language)
             template = default if default is not None else missing_key_msg
 
     return _format_translation(template, **kwargs)
@@ -569,12 +614,12 @@ def load_or_create_farmer_db():
     if os.path.exists(FARMER_CSV_PATH):
         try:
             df = pd.read_csv(FARMER_CSV_PATH, encoding='utf-8')
-            logger.debug(f"Read {len(df)} rows from {FARMER_CSV_PATH}")
+            logger.debug("Read %s rows from %s", len(df), FARMER_CSV_PATH)
             missing_cols = False
             for col in CSV_COLUMNS:
                 if col not in df.columns:
                     missing_cols = True
-                    logger.warning(f"Column '{col}' missing in {FARMER_CSV_PATH}, adding with default.")
+                    logger.warning("Column '%s' missing in %s, adding with default.", col, FARMER_CSV_PATH)
                     if col == 'latitude': df[col] = PROFILE_DEFAULT_LAT
                     elif col == 'longitude': df[col] = PROFILE_DEFAULT_LON
                     elif col == 'farm_size_ha': df[col] = 1.0
@@ -599,25 +644,25 @@ def load_or_create_farmer_db():
             df = df[CSV_COLUMNS]
 
             if missing_cols:
-                logger.info(f"Resaving {FARMER_CSV_PATH} after adding missing columns.")
+                logger.info("Resaving %s after adding missing columns.", FARMER_CSV_PATH)
                 try:
                     save_farmer_db(df)
                 except Exception as save_err:
-                    logger.error(f"Failed to resave {FARMER_CSV_PATH} after fixing columns: {save_err}")
+                    logger.error("Failed to resave %s after fixing columns: %s", FARMER_CSV_PATH, save_err)
                     st.warning(f"Could not auto-correct {FARMER_CSV_PATH}. Please check file integrity.")
 
-            logger.info(f"Loaded and validated {len(df)} profiles from {FARMER_CSV_PATH}")
+            logger.info("Loaded and validated %s profiles from %s", len(df), FARMER_CSV_PATH)
             return df
 
         except pd.errors.EmptyDataError:
-            logger.warning(f"{FARMER_CSV_PATH} is empty. Returning empty DataFrame.")
+            logger.warning("%s is empty. Returning empty DataFrame.", FARMER_CSV_PATH)
             return pd.DataFrame(columns=CSV_COLUMNS)
         except Exception as e:
-            logger.error(f"Error loading or processing {FARMER_CSV_PATH}: {e}", exc_info=True)
+            logger.error("Error loading or processing %s: %s", FARMER_CSV_PATH, e, exc_info=True)
             st.error(f"Could not load farmer profiles due to file error: {e}")
             return pd.DataFrame(columns=CSV_COLUMNS)
     else:
-        logger.info(f"{FARMER_CSV_PATH} not found. Creating an empty DataFrame structure.")
+        logger.info("%s not found. Creating an empty DataFrame structure.", FARMER_CSV_PATH)
         return pd.DataFrame(columns=CSV_COLUMNS)
 
 
@@ -646,14 +691,14 @@ def add_or_update_farmer(df, profile_data):
             final_val = default_val if pd.isna(num_val) else float(num_val)
             new_data[col] = final_val
             if pd.isna(num_val) and value is not None and str(value).strip() != "":
-                logger.warning(f"Invalid value '{value}' provided for {col} for farmer '{profile_name_clean}'. Using default {default_val}.")
+                logger.warning("Invalid value '%s' provided for %s for farmer '%s'. Using default %s.", value, col, profile_name_clean, default_val)
         elif col == 'longitude':
             default_val = PROFILE_DEFAULT_LON
             num_val = pd.to_numeric(value, errors='coerce')
             final_val = default_val if pd.isna(num_val) else float(num_val)
             new_data[col] = final_val
             if pd.isna(num_val) and value is not None and str(value).strip() != "":
-                logger.warning(f"Invalid value '{value}' provided for {col} for farmer '{profile_name_clean}'. Using default {default_val}.")
+                logger.warning("Invalid value '%s' provided for %s for farmer '%s'. Using default %s.", value, col, profile_name_clean, default_val)
         elif col == 'farm_size_ha':
             default_val = 1.0
             num_val = pd.to_numeric(value, errors='coerce')
@@ -661,9 +706,9 @@ def add_or_update_farmer(df, profile_data):
             final_val = value_float if value_float > 0 else default_val
             new_data[col] = final_val
             if pd.isna(num_val) and value is not None and str(value).strip() != "":
-                 logger.warning(f"Invalid value '{value}' provided for {col} for farmer '{profile_name_clean}'. Using default {default_val}.")
+                 logger.warning("Invalid value '%s' provided for %s for farmer '%s'. Using default %s.", value, col, profile_name_clean, default_val)
             elif value_float <= 0 and value is not None:
-                 logger.warning(f"Non-positive value '{value}' provided for {col} for farmer '{profile_name_clean}'. Using default {default_val}.")
+                 logger.warning("Non-positive value '%s' provided for %s for farmer '%s'. Using default %s.", value, col, profile_name_clean, default_val)
         elif col == 'name':
              new_data[col] = profile_name_clean
         elif col == 'language':
@@ -675,33 +720,33 @@ def add_or_update_farmer(df, profile_data):
         else:
              new_data[col] = str(value).strip() if pd.notna(value) else ''
 
-    logger.debug(f"add_or_update_farmer: Prepared validated data for {profile_name_clean}: {new_data}")
+    logger.debug("add_or_update_farmer: Prepared validated data for %s: %s", profile_name_clean, new_data)
 
     if not new_data.get('name'):
-        logger.error(f"Farmer name became invalid after cleaning for data: {profile_data}")
+        logger.error("Farmer name became invalid after cleaning for data: %s", profile_data)
         return df
 
     if existing_indices:
         idx_to_update = existing_indices[0]
-        logger.info(f"Updating profile for '{profile_name_clean}' at index {idx_to_update}")
+        logger.info("Updating profile for '%s' at index %s", profile_name_clean, idx_to_update)
         try:
             for col_assign in CSV_COLUMNS:
                 if col_assign not in df.columns: df[col_assign] = None
             for col_name in CSV_COLUMNS:
                  df.loc[idx_to_update, col_name] = new_data[col_name]
         except Exception as e:
-            logger.error(f"Error updating DataFrame row at index {idx_to_update}: {e}", exc_info=True)
+            logger.error("Error updating DataFrame row at index %s: %s", idx_to_update, e, exc_info=True)
             st.error(f"Internal error updating profile for {profile_name_clean}")
             return df
         return df
     else:
-        logger.info(f"Adding new profile for '{profile_name_clean}'")
+        logger.info("Adding new profile for '%s'", profile_name_clean)
         try:
             new_df_row = pd.DataFrame([new_data], columns=CSV_COLUMNS)
             df_updated = pd.concat([df, new_df_row], ignore_index=True)
             return df_updated[CSV_COLUMNS]
         except Exception as e:
-            logger.error(f"Error concatenating new profile row: {e}", exc_info=True)
+            logger.error("Error concatenating new profile row: %s", e, exc_info=True)
             st.error(f"Internal error adding profile for {profile_name_clean}")
             return df
 
@@ -714,7 +759,7 @@ def save_farmer_db(df):
 
     try:
         if not all(c in df.columns for c in CSV_COLUMNS):
-            logger.warning(f"DataFrame missing required columns before save. Has: {df.columns.tolist()}. Reindexing.")
+            logger.warning("DataFrame missing required columns before save. Has: %s. Reindexing.", df.columns.tolist())
             df_to_save = df.reindex(columns=CSV_COLUMNS).copy()
             df_to_save['latitude'] = df_to_save['latitude'].fillna(PROFILE_DEFAULT_LAT)
             df_to_save['longitude'] = df_to_save['longitude'].fillna(PROFILE_DEFAULT_LON)
@@ -737,14 +782,15 @@ def save_farmer_db(df):
         df_to_save['farm_size_ha'] = pd.to_numeric(df_to_save['farm_size_ha'], errors='coerce').fillna(1.0)
         df_to_save['farm_size_ha'] = df_to_save['farm_size_ha'].apply(lambda x: x if pd.notna(x) and x > 0 else 1.0)
 
-        logger.debug(f"save_farmer_db: Dataframe state just before sorting and saving ({len(df_to_save)} rows):\n{df_to_save.head().to_string()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("save_farmer_db: Dataframe state just before sorting and saving (%s rows):\n%s", len(df_to_save), df_to_save.head().to_string())
         df_sorted = df_to_save.sort_values(by='name', key=lambda col: col.str.lower(), na_position='last')
 
         df_sorted.to_csv(FARMER_CSV_PATH, index=False, encoding='utf-8')
-        logger.info(f"Successfully saved {len(df_sorted)} profiles to {FARMER_CSV_PATH}.")
+        logger.info("Successfully saved %s profiles to %s.", len(df_sorted), FARMER_CSV_PATH)
 
     except Exception as e:
-        logger.error(f"Error saving farmer profiles to {FARMER_CSV_PATH}: {e}", exc_info=True)
+        logger.error("Error saving farmer profiles to %s: %s", FARMER_CSV_PATH, e, exc_info=True)
         st.error(f"Could not save farmer profiles: {e}")
 
 
@@ -811,11 +857,11 @@ def log_qa(timestamp, farmer_name, language, query, response, internal_prompt):
             index=False,
             encoding='utf-8'
         )
-        logger.info(f"Logged Q&A for farmer '{farmer_name}' to {QA_LOG_PATH}")
+        logger.info("Logged Q&A for farmer '%s' to %s", farmer_name, QA_LOG_PATH)
     except IOError as e:
-        logger.error(f"IOError logging Q&A to {QA_LOG_PATH}: {e}", exc_info=True)
+        logger.error("IOError logging Q&A to %s: %s", QA_LOG_PATH, e, exc_info=True)
     except Exception as e:
-        logger.error(f"Unexpected error logging Q&A to {QA_LOG_PATH}: {e}", exc_info=True)
+        logger.error("Unexpected error logging Q&A to %s: %s", QA_LOG_PATH, e, exc_info=True)
 
 
 def initialize_llm(api_key):
@@ -827,6 +873,7 @@ def initialize_llm(api_key):
         st.error(ui_translator("gemini_key_error"))
         return None
     try:
+        from langchain_google_genai import ChatGoogleGenerativeAI
         llm = ChatGoogleGenerativeAI(
             model="gemini-1.5-flash",
             temperature=0.3,
@@ -835,7 +882,7 @@ def initialize_llm(api_key):
         logger.info("Google Gemini LLM object initialized successfully.")
         return llm
     except Exception as e:
-        logger.error(f"LLM Initialization failed: {e}", exc_info=True)
+        logger.error("LLM Initialization failed: %s", e, exc_info=True)
         error_message = ui_translator("llm_init_error")
         err_str = str(e).lower()
         if "api_key" in err_str or "permission" in err_str or "denied" in err_str or "authenticate" in err_str:
@@ -850,7 +897,7 @@ def initialize_llm(api_key):
 
 
 def predict_suitable_crops(soil_type, region, avg_temp, avg_rainfall, season):
-    logger.debug(f"Predicting crops: Soil={soil_type}, Region={region}, Temp={avg_temp}, Rain={avg_rainfall}, Season={season}")
+    logger.debug("Predicting crops: Soil=%s, Region=%s, Temp=%s, Rain=%s, Season=%s", soil_type, region, avg_temp, avg_rainfall, season)
     recommendations = []; soil_lower = soil_type.lower() if isinstance(soil_type, str) else ""
     if "loamy" in soil_lower or "alluvial" in soil_lower:
         if avg_rainfall > 600 and season == "Kharif": recommendations.extend(["Rice", "Cotton", "Sugarcane", "Maize"])
@@ -880,9 +927,8 @@ def predict_disease_from_image_placeholder():
     return random.choice(possible_results)
 
 def forecast_market_price(crop, market_name):
-    logger.debug(f"Forecasting market price for {crop} in {market_name} (placeholder).")
-    base_prices = {"Wheat": 2100, "Rice": 2800, "Maize": 1900, "Cotton": 6200, "Tomato": 1200, "Default": 2300}
-    base_price = base_prices.get(crop, base_prices["Default"])
+    logger.debug("Forecasting market price for %s in %s (placeholder).", crop, market_name)
+    base_price = MARKET_BASE_PRICES.get(crop, MARKET_BASE_PRICES["Default"])
     current_price = random.uniform(base_price * 0.9, base_price * 1.1)
     forecast_prices = []
     trend_factor = random.uniform(-0.03, 0.03)
@@ -916,21 +962,96 @@ def forecast_market_price(crop, market_name):
     }
 
 
-def get_weather_forecast(latitude, longitude, api_key):
+@st.cache_resource(show_spinner=False)
+def _get_weather_cache():
+    # Shared across sessions and reruns; OWM refreshes the 3-hourly forecast roughly every 10 minutes.
+    return threading.Lock(), {}
+
+@st.cache_resource(show_spinner=False)
+def _get_http_session():
+    # Keep-alive connection reused across reruns instead of a new TCP handshake per call.
+    session = requests.Session()
+    # Sized for concurrent sessions plus prefetch workers so returned connections are kept rather than discarded.
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+@st.cache_resource(show_spinner=False)
+def _get_weather_prefetch_executor():
+    # (executor, lock, in-flight futures by cache key, retry-not-before times by cache key, shared rate-limit state)
+    return ThreadPoolExecutor(max_workers=WEATHER_PREFETCH_WORKERS, thread_name_prefix="weather-prefetch"), threading.Lock(), {}, {}, {'last_submit': 0.0}
+
+def _weather_cache_key(lat_f, lon_f, api_key):
+    return (round(lat_f, 2), round(lon_f, 2), api_key)
+
+def prefetch_weather_forecast(latitude, longitude, api_key):
     try:
         lat_f = float(latitude)
         lon_f = float(longitude)
     except (ValueError, TypeError):
-        logger.warning(f"Invalid latitude ('{latitude}') or longitude ('{longitude}') for weather forecast.")
-        return {"status": "error", "message": "Invalid location coordinates provided."}
+        return
+    if (lat_f == 0.0 and lon_f == 0.0) or not api_key:
+        return
 
-    if lat_f == 0.0 and lon_f == 0.0:
-        logger.info("Weather forecast skipped: Location coordinates are 0.0, 0.0 (likely not set).")
-        return {"status": "error", "message": ui_translator("weather_data_error", message="Location not set in profile (or set to 0,0). Cannot fetch weather.")}
+    cache_key = _weather_cache_key(lat_f, lon_f, api_key)
+    if _is_weather_cache_fresh(cache_key):
+        return
 
-    if not api_key:
-        logger.warning("Weather API Key not provided for forecast.")
-        return {"status": "error", "message": ui_translator("weather_data_error", message="Weather API Key is missing in the configuration.")}
+    executor, in_flight_lock, in_flight, retry_after, rate_state = _get_weather_prefetch_executor()
+    now = time.monotonic()
+    with in_flight_lock:
+        if cache_key in in_flight or retry_after.get(cache_key, 0.0) > now:
+            return
+        # Prefetches are speculative, so cap them at one OWM request per interval across all sessions.
+        if now - rate_state['last_submit'] < WEATHER_PREFETCH_MIN_INTERVAL_SECONDS:
+            return
+        rate_state['last_submit'] = now
+        future = executor.submit(fetch_weather_forecast_data, lat_f, lon_f, api_key)
+        in_flight[cache_key] = future
+    future.add_done_callback(lambda done_future: _on_weather_prefetch_done(cache_key, done_future))
+
+def _on_weather_prefetch_done(cache_key, future):
+    _, in_flight_lock, in_flight, retry_after, _ = _get_weather_prefetch_executor()
+    error = future.exception()
+    with in_flight_lock:
+        if in_flight.get(cache_key) is future:
+            del in_flight[cache_key]
+        if error is None:
+            retry_after.pop(cache_key, None)
+            return
+        status_code = getattr(getattr(error, 'response', None), 'status_code', None)
+        # A rejected key will not start working by itself; only a foreground success clears it.
+        retry_after[cache_key] = float('inf') if status_code == 401 else time.monotonic() + WEATHER_PREFETCH_RETRY_SECONDS
+    logger.warning("Weather prefetch failed for %.2f,%.2f (status %s): %s", cache_key[0], cache_key[1], status_code, error)
+
+def _clear_weather_prefetch_failure(cache_key):
+    _, in_flight_lock, _, retry_after, _ = _get_weather_prefetch_executor()
+    with in_flight_lock:
+        retry_after.pop(cache_key, None)
+
+def _await_weather_prefetch(cache_key):
+    _, in_flight_lock, in_flight, _, _ = _get_weather_prefetch_executor()
+    with in_flight_lock:
+        future = in_flight.get(cache_key)
+    if future is not None:
+        wait([future])
+
+def _is_weather_cache_fresh(cache_key):
+    cache_lock, cache_entries = _get_weather_cache()
+    with cache_lock:
+        entry = cache_entries.get(cache_key)
+    return entry is not None and entry['expiry'] > time.monotonic()
+
+def fetch_weather_forecast_data(lat_f, lon_f, api_key):
+    cache_lock, cache_entries = _get_weather_cache()
+    cache_key = _weather_cache_key(lat_f, lon_f, api_key)
+    now = time.monotonic()
+    with cache_lock:
+        entry = cache_entries.get(cache_key)
+    if entry is not None and entry['expiry'] > now:
+        logger.debug("Weather cache hit for %.2f,%.2f.", cache_key[0], cache_key[1])
+        return entry['data']
 
     params = {
         'lat': lat_f,
@@ -939,21 +1060,104 @@ def get_weather_forecast(latitude, longitude, api_key):
         'units': 'metric',
         'cnt': 40
     }
+    headers = {}
+    if entry is not None:
+        if entry['etag']: headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']: headers['If-Modified-Since'] = entry['last_modified']
+
+    response = _get_http_session().get(WEATHER_API_URL, params=params, headers=headers, timeout=15)
+    if response.status_code == 304 and entry is not None:
+        logger.debug("Weather forecast not modified for %.2f,%.2f; reusing cached data.", cache_key[0], cache_key[1])
+        with cache_lock:
+            entry['expiry'] = time.monotonic() + WEATHER_CACHE_TTL_SECONDS
+        return entry['data']
+    response.raise_for_status()
+    if ORJSON_AVAILABLE:
+        try:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            # Match response.json() so a malformed body is still reported as a network error.
+            raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+    else:
+        data = response.json()
+
+    with cache_lock:
+        cache_entries.pop(cache_key, None)
+        if len(cache_entries) >= WEATHER_CACHE_MAX_ENTRIES:
+            cache_entries.pop(next(iter(cache_entries)))
+        cache_entries[cache_key] = {
+            'data': data,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'expiry': time.monotonic() + WEATHER_CACHE_TTL_SECONDS
+        }
+    return data
+
+
+@st.cache_resource(show_spinner=False)
+def _get_weather_summary_cache():
+    return threading.Lock(), {}
 
+def _get_cached_weather_summary(summary_key, data):
+    summary_lock, summaries = _get_weather_summary_cache()
+    with summary_lock:
+        cached = summaries.get(summary_key)
+    # A summary is only valid for the exact forecast payload it was built from; a 304 keeps that object alive.
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    return None
+
+def _store_weather_summary(summary_key, data, result):
+    summary_lock, summaries = _get_weather_summary_cache()
+    with summary_lock:
+        summaries.pop(summary_key, None)
+        if len(summaries) >= WEATHER_CACHE_MAX_ENTRIES:
+            summaries.pop(next(iter(summaries)))
+        summaries[summary_key] = (data, result)
+
+@dataclass(slots=True)
+class DailyForecastSummary:
+    day_idx: int
+    min_temp: float
+    max_temp: float
+    total_rain: float
+    conditions: set
+    alerts: set
+
+def _classify_weather_alert_levels(temps, rain_amounts, wind_speeds):
+    # One vectorized pass over all 3-hourly entries; NaN readings compare False and raise no alert.
+    rain_levels = np.select(
+        [rain_amounts > RAIN_ALERT_HEAVY_MM, rain_amounts > RAIN_ALERT_MODERATE_MM], [2, 1], default=0
+    ).tolist()
+    temp_levels = np.select(
+        [temps > TEMP_ALERT_VERY_HIGH_C, temps > TEMP_ALERT_HIGH_C, temps < TEMP_ALERT_LOW_C], [3, 2, 1], default=0
+    ).tolist()
+    wind_levels = np.select(
+        [wind_speeds > WIND_ALERT_VERY_STRONG_MS, wind_speeds > WIND_ALERT_STRONG_MS], [2, 1], default=0
+    ).tolist()
+    return rain_levels, temp_levels, wind_levels
+
+def get_weather_forecast(latitude, longitude, api_key):
     try:
-        response = requests.get(WEATHER_API_URL, params=params, timeout=15)
-        response.raise_for_status()
-        data = response.json()
-        logger.info(f"Weather data fetched successfully for {lat_f:.2f},{lon_f:.2f}.")
+        lat_f = float(latitude)
+        lon_f = float(longitude)
+    except (ValueError, TypeError):
+        logger.warning("Invalid latitude ('%s') or longitude ('%s') for weather forecast.", latitude, longitude)
+        return {"status": "error", "message": "Invalid location coordinates provided."}
+
+    if lat_f == 0.0 and lon_f == 0.0:
+        logger.info("Weather forecast skipped: Location coordinates are 0.0, 0.0 (likely not set).")
+        return {"status": "error", "message": ui_translator("weather_data_error", message="Location not set in profile (or set to 0,0). Cannot fetch weather.")}
+
+    if not api_key:
+        logger.warning("Weather API Key not provided for forecast.")
+        return {"status": "error", "message": ui_translator("weather_data_error", message="Weather API Key is missing in the configuration.")}
 
-        daily_forecasts = defaultdict(lambda: {
-            'min_temp': float('inf'),
-            'max_temp': float('-inf'),
-            'conditions': set(),
-            'total_rain': 0.0,
-            'alerts': set(),
-            'raw_temps': [], 'raw_humidities': [], 'raw_windspeeds': []
-        })
+    try:
+        _await_weather_prefetch(_weather_cache_key(lat_f, lon_f, api_key))
+        data = fetch_weather_forecast_data(lat_f, lon_f, api_key)
+        _clear_weather_prefetch_failure(_weather_cache_key(lat_f, lon_f, api_key))
+        logger.info("Weather data fetched successfully for %.2f,%.2f.", lat_f, lon_f)
 
         if 'list' not in data or not isinstance(data['list'], list):
             logger.error("Unexpected weather API response format: 'list' key missing or not a list.")
@@ -962,6 +1166,21 @@ def get_weather_forecast(latitude, longitude, api_key):
         city_info = data.get('city', {})
         location_name = city_info.get('name', f"Lat:{lat_f:.2f},Lon:{lon_f:.2f}")
 
+        # Bucket entries by whole days since the epoch in the forecast location's local time.
+        city_tz_offset = city_info.get('timezone')
+        if isinstance(city_tz_offset, (int, float)) and -86400 < city_tz_offset < 86400:
+            utc_offset_s = int(city_tz_offset)
+        else:
+            utc_offset_s = time.localtime().tm_gmtoff
+        today_idx = (int(time.time()) + utc_offset_s) // 86400
+
+        summary_key = (_weather_cache_key(lat_f, lon_f, api_key), st.session_state.get('selected_language', "English"), today_idx)
+        cached_summary = _get_cached_weather_summary(summary_key, data)
+        if cached_summary is not None:
+            return cached_summary
+
+        entry_days, entry_ts, entry_descriptions = [], [], []
+        entry_temps, entry_min_temps, entry_max_temps, entry_rain, entry_wind = [], [], [], [], []
         for forecast_item in data['list']:
              if not isinstance(forecast_item, dict) or 'dt' not in forecast_item or 'main' not in forecast_item or 'weather' not in forecast_item: continue
              if not isinstance(forecast_item['weather'], list) or not forecast_item['weather']: continue
@@ -972,77 +1191,95 @@ def get_weather_forecast(latitude, longitude, api_key):
              if 'temp_min' not in main_data or 'temp_max' not in main_data or 'description' not in weather_data: continue
 
              try:
-                 dt_object = datetime.datetime.fromtimestamp(forecast_item['dt'])
-                 date_str = dt_object.strftime("%Y-%m-%d")
-                 temp = float(main_data.get('temp', pd.NA))
+                 day_idx = (int(forecast_item['dt']) + utc_offset_s) // 86400
+                 # A missing 'temp' must not drop the entry; NaN is ignored by the alert rules but keeps temp_min/max and rain.
+                 temp = main_data.get('temp')
+                 temp = float(temp) if temp is not None else float('nan')
                  temp_min = float(main_data['temp_min'])
                  temp_max = float(main_data['temp_max'])
-                 humidity = float(main_data.get('humidity', pd.NA))
                  description_formatted = weather_data['description'].capitalize()
                  rain_3h = float(forecast_item.get('rain', {}).get('3h', 0.0))
                  wind_speed = float(forecast_item.get('wind', {}).get('speed', 0.0))
 
              except (KeyError, ValueError, TypeError) as e:
-                 logger.warning(f"Skipping forecast item due to data parsing error ({e}): {forecast_item}")
+                 logger.warning("Skipping forecast item due to data parsing error (%s): %s", e, forecast_item)
                  continue
 
-             day_data = daily_forecasts[date_str]
-             day_data['min_temp'] = min(day_data['min_temp'], temp_min)
-             day_data['max_temp'] = max(day_data['max_temp'], temp_max)
-             day_data['conditions'].add(description_formatted)
-             day_data['total_rain'] += rain_3h
-
-             if pd.notna(temp): day_data['raw_temps'].append(temp)
-             if pd.notna(humidity): day_data['raw_humidities'].append(humidity)
-             if pd.notna(wind_speed): day_data['raw_windspeeds'].append(wind_speed)
-
-             if rain_3h > 7: day_data['alerts'].add(f"Heavy rain ({rain_3h:.1f}mm/3hr)")
-             elif rain_3h > 2: day_data['alerts'].add(f"Moderate rain ({rain_3h:.1f}mm/3hr)")
-             if pd.notna(temp) and temp > 40: day_data['alerts'].add(f"Very High Temp ({temp:.0f}°C)")
-             elif pd.notna(temp) and temp > 37: day_data['alerts'].add(f"High Temp ({temp:.0f}°C)")
-             elif pd.notna(temp) and temp < 8: day_data['alerts'].add(f"Low Temp ({temp:.0f}°C)")
-             if pd.notna(wind_speed) and wind_speed > 17:
-                 day_data['alerts'].add(f"Very Strong Wind ({wind_speed * 3.6:.0f} km/h)")
-             elif pd.notna(wind_speed) and wind_speed > 12:
-                 day_data['alerts'].add(f"Strong Wind ({wind_speed * 3.6:.0f} km/h)")
+             entry_days.append(day_idx); entry_ts.append(int(forecast_item['dt']))
+             entry_descriptions.append(description_formatted)
+             entry_temps.append(temp); entry_min_temps.append(temp_min); entry_max_temps.append(temp_max)
+             entry_rain.append(rain_3h); entry_wind.append(wind_speed)
+
+        # OWM returns entries in chronological order, so days form contiguous runs; only re-sort if that ever breaks.
+        timestamps = np.asarray(entry_ts, dtype=np.int64)
+        days = np.asarray(entry_days, dtype=np.int64)
+        min_temps = np.asarray(entry_min_temps, dtype=np.float64)
+        max_temps = np.asarray(entry_max_temps, dtype=np.float64)
+        temps = np.asarray(entry_temps, dtype=np.float64)
+        wind_speeds = np.asarray(entry_wind, dtype=np.float64)
+        rain_amounts = np.asarray(entry_rain, dtype=np.float64)
+        if np.any(timestamps[1:] < timestamps[:-1]):
+            order = np.argsort(timestamps, kind='stable')
+            days, min_temps, max_temps, temps, wind_speeds, rain_amounts = (
+                days[order], min_temps[order], max_temps[order], temps[order], wind_speeds[order], rain_amounts[order]
+            )
+            entry_descriptions = [entry_descriptions[i] for i in order.tolist()]
+        rain_levels, temp_levels, wind_levels = _classify_weather_alert_levels(temps, rain_amounts, wind_speeds)
+
+        daily_summaries = []
+        if len(days):
+            group_starts = np.flatnonzero(np.concatenate(([True], days[1:] != days[:-1])))
+            group_ends = np.append(group_starts[1:], len(days))
+            daily_min_temps = np.minimum.reduceat(min_temps, group_starts).tolist()
+            daily_max_temps = np.maximum.reduceat(max_temps, group_starts).tolist()
+            daily_total_rain = np.add.reduceat(rain_amounts, group_starts).tolist()
+            # Days are sorted, so binary-search the first one not before today and only build the shown window.
+            first_day = int(np.searchsorted(days[group_starts], today_idx))
+            shown_days = range(first_day, min(first_day + FORECAST_SUMMARY_DAYS, len(group_starts)))
+            group_starts, group_ends = group_starts.tolist(), group_ends.tolist()
+            for pos in shown_days:
+                start, end = group_starts[pos], group_ends[pos]
+                alerts = set()
+                for i in range(start, end):
+                    if rain_levels[i]: alerts.add(RAIN_ALERT_LABELS[rain_levels[i]].format(value=rain_amounts[i]))
+                    if temp_levels[i]: alerts.add(TEMP_ALERT_LABELS[temp_levels[i]].format(value=temps[i]))
+                    if wind_levels[i]: alerts.add(WIND_ALERT_LABELS[wind_levels[i]].format(value=wind_speeds[i] * 3.6))
+                daily_summaries.append(DailyForecastSummary(
+                    day_idx=int(days[start]),
+                    min_temp=daily_min_temps[pos],
+                    max_temp=daily_max_temps[pos],
+                    total_rain=daily_total_rain[pos],
+                    conditions=set(entry_descriptions[start:end]),
+                    alerts=alerts
+                ))
 
         processed_summary = []
-        today = datetime.date.today()
-        tomorrow = today + datetime.timedelta(days=1)
-        sorted_dates = sorted(daily_forecasts.keys())
-
-        days_added = 0
-        for date_str in sorted_dates:
-            if days_added >= 5: break
-            day_data = daily_forecasts[date_str]
-            try:
-                date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-                if date_obj < today: continue
-                day_name = date_obj.strftime("%a")
-            except ValueError:
-                continue
+        for day_data in daily_summaries:
+            day_idx = day_data.day_idx
+            date_obj = datetime.date.fromordinal(UNIX_EPOCH_ORDINAL + day_idx)
+            day_name = WEEKDAY_ABBREVIATIONS[date_obj.weekday()]
 
             day_label_key = "day_label_" + day_name.lower()
             day_label_translation = ui_translator(day_label_key, default=day_name)
-            if date_obj == today: day_label = ui_translator("label_today", default="Today")
-            elif date_obj == tomorrow: day_label = ui_translator("label_tomorrow", default="Tomorrow")
+            if day_idx == today_idx: day_label = ui_translator("label_today", default="Today")
+            elif day_idx == today_idx + 1: day_label = ui_translator("label_tomorrow", default="Tomorrow")
             else: day_label = day_label_translation
 
-            conditions_list = sorted(list(day_data['conditions']))
+            conditions_list = sorted(list(day_data.conditions))
             if 'Light rain' in conditions_list and 'Rain' in conditions_list: conditions_list.remove('Light rain')
             if 'Few clouds' in conditions_list and ('Scattered clouds' in conditions_list or 'Broken clouds' in conditions_list or 'Overcast clouds' in conditions_list): conditions_list.remove('Few clouds')
             conditions_str = ", ".join(conditions_list) if conditions_list else ui_translator("conditions_unclear")
 
             rain_str = ""
-            if day_data['total_rain'] > 0.1:
-                 rain_str = ui_translator("weather_rain_display", value=float(day_data['total_rain']))
+            if day_data.total_rain > 0.1:
+                 rain_str = ui_translator("weather_rain_display", value=float(day_data.total_rain))
 
             alerts_str = ""
-            if day_data['alerts']:
-                 alerts_str = ui_translator("weather_alerts_display", alerts_joined=", ".join(sorted(list(day_data['alerts']))))
+            if day_data.alerts:
+                 alerts_str = ui_translator("weather_alerts_display", alerts_joined=", ".join(sorted(list(day_data.alerts))))
 
-            min_t_str = f"{day_data['min_temp']:.0f}" if day_data['min_temp'] != float('inf') else ui_translator("value_na")
-            max_t_str = f"{day_data['max_temp']:.0f}" if day_data['max_temp'] != float('-inf') else ui_translator("value_na")
+            min_t_str = f"{day_data.min_temp:.0f}" if day_data.min_temp != float('inf') else ui_translator("value_na")
+            max_t_str = f"{day_data.max_temp:.0f}" if day_data.max_temp != float('-inf') else ui_translator("value_na")
 
             summary_line = (
                 f"{day_label} ({date_obj.strftime('%d %b')}): "
@@ -1052,22 +1289,23 @@ def get_weather_forecast(latitude, longitude, api_key):
                 f"{alerts_str}"
             ).strip().replace("  ", " ")
             processed_summary.append(summary_line)
-            days_added += 1
 
         if not processed_summary:
-            logger.warning(f"Could not generate daily forecast summary for {lat_f},{lon_f}, though API call succeeded.")
+            logger.warning("Could not generate daily forecast summary for %s,%s, though API call succeeded.", lat_f, lon_f)
             return {"status": "error", "message": ui_translator("weather_error_summary_generation")}
 
-        return {
+        result = {
             "status": "success",
             "location": location_name,
             "daily_summary": processed_summary
         }
+        _store_weather_summary(summary_key, data, result)
+        return result
 
     except requests.exceptions.HTTPError as e:
         status_code = e.response.status_code if e.response else None
         error_text = e.response.text if e.response else "No response body"
-        logger.error(f"HTTP error fetching weather: {status_code} - {error_text}", exc_info=False)
+        logger.error("HTTP error fetching weather: %s - %s", status_code, error_text, exc_info=False)
         if status_code == 401: message_key = "weather_error_401"
         elif status_code == 404: message_key = "weather_error_404"
         elif status_code == 429: message_key = "weather_error_429"
@@ -1076,11 +1314,11 @@ def get_weather_forecast(latitude, longitude, api_key):
         return {"status": "error", "message": ui_translator("weather_data_error", message=message)}
 
     except requests.exceptions.RequestException as e:
-        logger.error(f"Network error fetching weather: {e}", exc_info=True)
+        logger.error("Network error fetching weather: %s", e, exc_info=True)
         message = ui_translator("weather_error_network")
         return {"status": "error", "message": ui_translator("weather_data_error", message=message)}
     except Exception as e:
-        logger.error(f"Unexpected error processing weather data: {e}", exc_info=True)
+        logger.error("Unexpected error processing weather data: %s", e, exc_info=True)
         message = ui_translator("weather_error_unexpected", error=str(e))
         return {"status": "error", "message": ui_translator("weather_data_error", message=message)}
 
@@ -1114,7 +1352,7 @@ Synthesize all this information to answer the farmer's MOST RECENT query.
     ]
     messages_for_llm.extend(chat_history_messages)
 
-    logger.debug(f"Generating response using {len(chat_history_messages)} history messages. Output lang: {output_language}")
+    logger.debug("Generating response using %s history messages. Output lang: %s", len(chat_history_messages), output_language)
 
     try:
         ai_response = llm.invoke(messages_for_llm)
@@ -1124,7 +1362,7 @@ Synthesize all this information to answer the farmer's MOST RECENT query.
         return response_content.strip()
 
     except Exception as e:
-        logger.error(f"Exception calling LLM invoke with history: {e}", exc_info=True)
+        logger.error("Exception calling LLM invoke with history: %s", e, exc_info=True)
         err_msg = ui_translator("processing_error", e=f"AI communication failure ({type(e).__name__})")
         err_str = str(e).lower()
         if "api key" in err_str or "permission" in err_str or "denied" in err_str or "authenticate" in err_str:
@@ -1140,8 +1378,8 @@ Synthesize all this information to answer the farmer's MOST RECENT query.
                          reason_part = parts[1].split(')')[0].split(',')[0].strip()
                          reason = reason_part.capitalize() if reason_part else "Safety Filter"
              except Exception as parse_err:
-                  logger.warning(f"Could not parse safety block reason: {parse_err}")
-             logger.warning(f"LLM response potentially blocked by API. Reason: {reason}")
+                  logger.warning("Could not parse safety block reason: %s", parse_err)
+             logger.warning("LLM response potentially blocked by API. Reason: %s", reason)
              err_msg = f"{ui_translator('processing_error', e=f'Response blocked by content filter ({reason})')}"
 
         return err_msg
@@ -1157,7 +1395,7 @@ def process_farmer_request(farmer_profile, current_query, chat_history, llm, wea
     farmer_name = str(farmer_profile['name']).strip()
     query_clean = str(current_query).strip()
     query_lower = query_clean.lower()
-    logger.info(f"Processing query for farmer '{farmer_name}': '{query_clean}' | Output Lang: {output_language}")
+    logger.info("Processing query for farmer '%s': '%s' | Output Lang: %s", farmer_name, query_clean, output_language)
 
     lat = farmer_profile.get('latitude', PROFILE_DEFAULT_LAT)
     lon = farmer_profile.get('longitude', PROFILE_DEFAULT_LON)
@@ -1176,22 +1414,16 @@ def process_farmer_request(farmer_profile, current_query, chat_history, llm, wea
     if isinstance(farm_size, (int, float)) and pd.notna(farm_size) and farm_size > 0:
         size_str = f"{farm_size:.2f} Ha"
 
-    static_context_lines.append(ui_translator('farmer_context_data', name=farmer_name, location_description=location_desc, soil=soil, size=size_str))
-    static_context_lines.append("")
+    static_context_lines.extend((ui_translator('farmer_context_data', name=farmer_name, location_description=location_desc, soil=soil, size=size_str), ""))
 
     intent_identified = False
-    crop_keywords = ["crop recommend", "suggest crop", "kya ugana", "फसल सुझा", "பயிர்களைப் பரிந்துரை", "ফসল সুপারিশ", "పంటలను సూచిం", "पिके सुचवा", "grow next", "suitable crop", "कौन सी फसल", "எந்தப் பயிர்", "plant next"]
-    market_keywords = ["market price", "mandi rate", "bazaar price", "बाजार भाव", "சந்தை விலை", "বাজার দর", "మార్కెట్ ధర", "बाजार भाव", "what price", "selling price", "bhav", "kimat"]
-    weather_keywords = ["weather", "forecast", "mausam", "मौसम", "வானிலை", "আবহাওয়া", "వాతావరణం", "हवामान", "rain", "temperature", "barish", "tapman", "humidity", "wind"]
-    health_keywords = ["disease", "pest", "infection", "sick plant", "plant health", "रोग", "कीट", "நோய்", "রোগ", "తెగులు", "कीड", "problem with plant", "issue with crop"]
 
-    if any(keyword in query_lower for keyword in weather_keywords):
+    if any(keyword in query_lower for keyword in WEATHER_INTENT_KEYWORDS):
         intent_identified = True
         logger.info("Intent Detected: Weather Forecast & Implications")
-        static_context_lines.append(ui_translator('intent_weather'))
         weather_info = get_weather_forecast(lat_f, lon_f, weather_api_key)
         loc_name_weather = location_desc if weather_info.get('location', None) is None else weather_info.get('location', location_desc)
-        static_context_lines.append(ui_translator('context_header_weather', location=loc_name_weather))
+        static_context_lines.extend((ui_translator('intent_weather'), ui_translator('context_header_weather', location=loc_name_weather)))
         if weather_info.get('status') == 'success':
             summary_list = weather_info.get('daily_summary', [])
             if summary_list:
@@ -1201,35 +1433,31 @@ def process_farmer_request(farmer_profile, current_query, chat_history, llm, wea
         else:
             error_msg_weather = weather_info.get('message', ui_translator('weather_error_unknown'))
             static_context_lines.append(ui_translator('context_weather_unavailable', error_msg=error_msg_weather))
-        static_context_lines.append(ui_translator('context_footer_weather'))
-        static_context_lines.append("")
+        static_context_lines.extend((ui_translator('context_footer_weather'), ""))
 
-    elif any(keyword in query_lower for keyword in crop_keywords):
+    elif any(keyword in query_lower for keyword in CROP_INTENT_KEYWORDS):
         intent_identified = True
         logger.info("Intent Detected: Crop Recommendation")
-        static_context_lines.append(ui_translator('intent_crop'))
         region = location_desc
         avg_temp = random.uniform(20, 35)
         avg_rainfall = random.uniform(400, 800)
         season = "Kharif" if 6 <= datetime.datetime.now().month <= 10 else "Rabi"
         suggested_crops = predict_suitable_crops(soil, region, avg_temp, avg_rainfall, season)
 
-        static_context_lines.append(ui_translator('context_header_crop'))
-        static_context_lines.append(ui_translator('context_factors_crop', soil=soil, season=season))
         crops_str = ', '.join(suggested_crops) if suggested_crops else ui_translator("no_crops_recommendation")
-        static_context_lines.append(ui_translator('context_crop_ideas', crops=crops_str))
-        static_context_lines.append(ui_translator('context_footer_crop'))
-        static_context_lines.append("")
-
-    elif any(keyword in query_lower for keyword in market_keywords):
+        static_context_lines.extend((
+            ui_translator('intent_crop'),
+            ui_translator('context_header_crop'),
+            ui_translator('context_factors_crop', soil=soil, season=season),
+            ui_translator('context_crop_ideas', crops=crops_str),
+            ui_translator('context_footer_crop'),
+            ""
+        ))
+
+    elif any(keyword in query_lower for keyword in MARKET_INTENT_KEYWORDS):
         intent_identified = True
         logger.info("Intent Detected: Market Price")
-        static_context_lines.append(ui_translator('intent_market'))
-        crop = "Wheat"
-        if any(c in query_lower for c in ["rice", "chawal", "धान", "चावल", "அரிசி", "চাল", "బియ్యం", "तांदूळ"]): crop = "Rice"
-        elif any(c in query_lower for c in ["maize", "makka", "मक्का", "சோளம்", "ভুট্টা", "మొక్కజొన్న", "मका"]): crop = "Maize"
-        elif any(c in query_lower for c in ["cotton", "kapas", "कपास", "பருத்தி", "তুলা", "పత్తి", "कापूस"]): crop = "Cotton"
-        elif any(c in query_lower for c in ["tomato", "tamatar", "टमाटर", "தக்காளி", "টমেটো", "టమోటా", "टोमॅटो"]): crop = "Tomato"
+        crop = next((name for name, keywords in MARKET_CROP_KEYWORDS if any(c in query_lower for c in keywords)), "Wheat")
 
         market = "Nearby Mandi"
         forecast = forecast_market_price(crop, market)
@@ -1237,45 +1465,48 @@ def process_farmer_request(farmer_profile, current_query, chat_history, llm, wea
         price_start = float(prices[0]) if prices else 0.0
         price_end = float(prices[-1]) if prices else 0.0
 
-        static_context_lines.append(ui_translator('context_header_market', crop=forecast.get('crop',crop), market=forecast.get('market',market)))
-        static_context_lines.append(
+        static_context_lines.extend((
+            ui_translator('intent_market'),
+            ui_translator('context_header_market', crop=forecast.get('crop',crop), market=forecast.get('market',market)),
             ui_translator(
                 'context_data_market',
                 days=forecast.get('forecast_days', 0),
                 price_start=price_start,
                 price_end=price_end,
                 trend=forecast.get('trend_suggestion', ui_translator("value_na"))
-            )
-        )
-        static_context_lines.append(ui_translator('context_footer_market'))
-        static_context_lines.append("")
+            ),
+            ui_translator('context_footer_market'),
+            ""
+        ))
 
-    elif any(keyword in query_lower for keyword in health_keywords):
+    elif any(keyword in query_lower for keyword in HEALTH_INTENT_KEYWORDS):
          intent_identified = True
          logger.info("Intent Detected: Plant Health (Placeholder)")
-         static_context_lines.append(ui_translator('intent_health'))
          detection = predict_disease_from_image_placeholder()
          conf_f = float(detection.get('confidence', 0.0))
 
-         static_context_lines.append(ui_translator('context_header_health'))
-         static_context_lines.append(
+         static_context_lines.extend((
+             ui_translator('intent_health'),
+             ui_translator('context_header_health'),
              ui_translator(
                  'context_data_health',
                  disease=detection.get('disease', ui_translator("value_na")),
                  confidence=conf_f,
                  treatment=detection.get('treatment', ui_translator("value_na"))
-             )
-         )
-         static_context_lines.append(ui_translator('context_footer_health'))
-         static_context_lines.append("")
+             ),
+             ui_translator('context_footer_health'),
+             ""
+         ))
 
     if not intent_identified:
         logger.info("Intent Detected: General Question")
-        static_context_lines.append(ui_translator('intent_general'))
-        static_context_lines.append(ui_translator('context_header_general'))
-        static_context_lines.append(ui_translator('context_data_general', query=query_clean))
-        static_context_lines.append(ui_translator('context_footer_general'))
-        static_context_lines.append("")
+        static_context_lines.extend((
+            ui_translator('intent_general'),
+            ui_translator('context_header_general'),
+            ui_translator('context_data_general', query=query_clean),
+            ui_translator('context_footer_general'),
+            ""
+        ))
 
     debug_internal_prompt_for_log = "\n".join(static_context_lines)
 
@@ -1296,19 +1527,20 @@ def process_farmer_request(farmer_profile, current_query, chat_history, llm, wea
         is_error_response = True
         final_response = ui_translator("processing_error", e="No response received.")
     elif isinstance(final_response, str):
-         known_error_keys = ["gemini_key_error", "processing_error", "llm_init_error", "system_error_label", "weather_data_error", "weather_error_", "tts_error_"]
-         translated_errors = [ui_translator(k, default=f"_ERR_{k}_") for k in known_error_keys]
          response_lower = final_response.lower()
-         if any(err_indicator in response_lower for err_indicator in ["error:", "sorry, i cannot", "warning:", "could not process", "internal error", "invalid api key", "exception:", "blocked by content", "filter", "unable to", "failed to", "api key validation failed"]) or \
-            any(translated_err in final_response for translated_err in translated_errors if not translated_err.startswith("_ERR_")):
+         if any(err_indicator in response_lower for err_indicator in RESPONSE_ERROR_INDICATORS):
               is_error_response = True
+         else:
+              # Only translate the known error messages when the cheap literal checks found nothing.
+              translated_errors = (ui_translator(k, default=f"_ERR_{k}_") for k in RESPONSE_ERROR_KEYS)
+              is_error_response = any(translated_err in final_response for translated_err in translated_errors if not translated_err.startswith("_ERR_"))
 
     if not is_error_response:
         status = "success"
         log_qa(datetime.datetime.now(), farmer_name, output_language, query_clean, final_response, debug_internal_prompt_for_log)
     else:
         status = "error"
-        logger.warning(f"Error response generated or LLM failed for farmer '{farmer_name}'. Response/Error: {final_response}")
+        logger.warning("Error response generated or LLM failed for farmer '%s'. Response/Error: %s", farmer_name, final_response)
         error_prefix = f"{ui_translator('system_error_label')}: "
         if not final_response.startswith(error_prefix) and not final_response.lower().startswith("error:"):
             final_response_for_log = error_prefix + final_response
@@ -1350,7 +1582,7 @@ def handle_map_interaction_reference(map_key="folium_map_reference", center=None
                     [ref_lat_f, ref_lon_f], popup=f"Ref: {ref_lat_f:.6f}, {ref_lon_f:.6f}",
                     tooltip=ui_translator("map_click_reference"), icon=folium.Icon(color='orange', icon='info-sign')
                 ).add_to(m)
-            except (ValueError, TypeError): logger.warning(f"Invalid reference coords in session: {ref_coords}")
+            except (ValueError, TypeError): logger.warning("Invalid reference coords in session: %s", ref_coords)
 
     current_profile = st.session_state.get('current_farmer_profile')
     if current_profile:
@@ -1363,7 +1595,7 @@ def handle_map_interaction_reference(map_key="folium_map_reference", center=None
                      [prof_lat_f, prof_lon_f], popup=f"Current: {prof_lat_f:.6f}, {prof_lon_f:.6f}",
                      tooltip=ui_translator('active_profile_loc'), icon=folium.Icon(color='blue', icon='home')
                  ).add_to(m)
-             except (ValueError, TypeError): logger.warning(f"Invalid profile coords for map marker: lat={prof_lat}, lon={prof_lon}")
+             except (ValueError, TypeError): logger.warning("Invalid profile coords for map marker: lat=%s, lon=%s", prof_lat, prof_lon)
 
     map_data = st_folium(
         m, center=map_center_to_use, zoom=map_zoom_to_use,
@@ -1395,7 +1627,7 @@ def handle_map_interaction_reference(map_key="folium_map_reference", center=None
             current_ref = st.session_state.get('map_clicked_ref_coords')
             if (not current_ref or current_ref.get('lat') is None or current_ref.get('lon') is None or
                 abs(clicked_lat - current_ref.get('lat', 0.0)) > 1e-7 or abs(clicked_lon - current_ref.get('lon', 0.0)) > 1e-7):
-                logger.info(f"Map Click (Reference Update via '{map_key}'): Lat={clicked_lat:.6f}, Lon={clicked_lon:.6f}")
+                logger.info("Map Click (Reference Update via '%s'): Lat=%.6f, Lon=%.6f", map_key, clicked_lat, clicked_lon)
                 st.session_state.map_clicked_ref_coords = {'lat': clicked_lat, 'lon': clicked_lon}
                 st.rerun()
 
@@ -1423,23 +1655,23 @@ def display_past_interactions(farmer_name):
         try:
             log_df = pd.read_csv(qa_log_file, encoding='utf-8', keep_default_na=False, low_memory=False)
         except pd.errors.ParserError as parse_err:
-             logger.error(f"Parsing error in {qa_log_file}: {parse_err}. Trying recovery.")
+             logger.error("Parsing error in %s: %s. Trying recovery.", qa_log_file, parse_err)
              st.warning(f"Warning: Could not parse parts of the QA log file ({parse_err}). Displaying available entries.")
              try:
                  log_df = pd.read_csv(qa_log_file, encoding='utf-8', keep_default_na=False, on_bad_lines='warn')
              except Exception as read_err_fallback:
-                  logger.error(f"Fallback reading failed for {qa_log_file}: {read_err_fallback}")
+                  logger.error("Fallback reading failed for %s: %s", qa_log_file, read_err_fallback)
                   st.error(ui_translator("error_displaying_logs", error=f"Could not parse log file: {read_err_fallback}"))
                   return
         except Exception as read_err:
-             logger.error(f"Error reading QA log file {qa_log_file}: {read_err}", exc_info=True)
+             logger.error("Error reading QA log file %s: %s", qa_log_file, read_err, exc_info=True)
              st.error(ui_translator("error_displaying_logs", error=str(read_err)))
              return
 
         required_cols = ['timestamp', 'farmer_name', 'language', 'query', 'response']
         missing_cols = [col for col in required_cols if col not in log_df.columns]
         if missing_cols:
-             logger.error(f"Past interactions log {qa_log_file} missing columns: {missing_cols}")
+             logger.error("Past interactions log %s missing columns: %s", qa_log_file, missing_cols)
              st.error(ui_translator("log_file_corrupt_columns", path=qa_log_file, cols=", ".join(missing_cols)))
              return
 
@@ -1472,13 +1704,13 @@ def display_past_interactions(farmer_name):
             )
 
     except FileNotFoundError:
-         logger.info(f"QA log file {qa_log_file} not found while trying to display interactions.")
+         logger.info("QA log file %s not found while trying to display interactions.", qa_log_file)
          st.info(ui_translator("no_past_interactions"))
     except pd.errors.EmptyDataError:
-         logger.info(f"QA log file {qa_log_file} is empty.")
+         logger.info("QA log file %s is empty.", qa_log_file)
          st.info(ui_translator("no_past_interactions"))
     except Exception as e:
-        logger.error(f"Unexpected error reading/displaying past interactions log {qa_log_file} for {farmer_name}: {e}", exc_info=True)
+        logger.error("Unexpected error reading/displaying past interactions log %s for %s: %s", qa_log_file, farmer_name, e, exc_info=True)
         st.error(ui_translator("error_displaying_logs", error=str(e)))
 
 
@@ -1490,18 +1722,19 @@ def generate_audio_bytes(text_to_speak, lang_code):
         logger.error("gTTS library not available, cannot generate audio.")
         return None
     if not text_to_speak or not lang_code:
-        logger.warning(f"generate_audio_bytes called with empty text or lang_code.")
+        logger.warning("generate_audio_bytes called with empty text or lang_code.")
         return None
 
     try:
+        from gtts import gTTS
         tts = gTTS(text=text_to_speak, lang=lang_code, slow=False)
         audio_fp = io.BytesIO()
         tts.write_to_fp(audio_fp)
         audio_fp.seek(0)
-        logger.info(f"Successfully generated audio bytes in '{lang_code}'.")
+        logger.info("Successfully generated audio bytes in '%s'.", lang_code)
         return audio_fp
     except Exception as e:
-        logger.error(f"Error generating TTS audio ({lang_code}): {e}", exc_info=True)
+        logger.error("Error generating TTS audio (%s): %s", lang_code, e, exc_info=True)
         return None
 
 
@@ -1530,7 +1763,7 @@ def main():
         new_lang = st.session_state.widget_lang_select_key
         if st.session_state.selected_language != new_lang:
              st.session_state.selected_language = new_lang
-             logger.info(f"Site language MANUALLY changed to {st.session_state.selected_language} via dropdown.")
+             logger.info("Site language MANUALLY changed to %s via dropdown.", st.session_state.selected_language)
         else:
             logger.debug("Language change callback triggered, but language is already set.")
 
@@ -1543,7 +1776,7 @@ def main():
         try:
             current_lang_index = language_options.index(st.session_state.selected_language)
         except ValueError:
-             logger.warning(f"Session lang '{st.session_state.selected_language}' not in options, defaulting UI to English.")
+             logger.warning("Session lang '%s' not in options, defaulting UI to English.", st.session_state.selected_language)
              current_lang_index = 0
              if st.session_state.selected_language != "English": st.session_state.selected_language = "English"
 
@@ -1603,9 +1836,9 @@ def main():
                          if loaded_language in translations and st.session_state.selected_language != loaded_language:
                              st.session_state.selected_language = loaded_language
                              language_changed = True
-                             logger.info(f"App language sync to '{loaded_language}' from loaded profile: {profile['name']}.")
+                             logger.info("App language sync to '%s' from loaded profile: %s.", loaded_language, profile['name'])
                          elif loaded_language not in translations:
-                             logger.warning(f"Profile '{profile['name']}' invalid lang '{loaded_language}', keeping app lang {st.session_state.selected_language}.")
+                             logger.warning("Profile '%s' invalid lang '%s', keeping app lang %s.", profile['name'], loaded_language, st.session_state.selected_language)
 
                          loaded_lat = profile.get('latitude', PROFILE_DEFAULT_LAT)
                          loaded_lon = profile.get('longitude', PROFILE_DEFAULT_LON)
@@ -1619,7 +1852,7 @@ def main():
                          for key in ['_form_lat_default','_form_lon_default','_form_soil_default','_form_size_default','_form_lang_default']:
                               if key in st.session_state: del st.session_state[key]
 
-                         logger.info(f"Profile loaded for '{profile['name']}'. Rerun (Lang changed: {language_changed}).")
+                         logger.info("Profile loaded for '%s'. Rerun (Lang changed: %s).", profile['name'], language_changed)
                          st.rerun()
                      else:
                          st.warning(ui_translator("profile_not_found_warning", name=current_entered_name))
@@ -1638,9 +1871,9 @@ def main():
                          if existing_language in translations and st.session_state.selected_language != existing_language:
                              st.session_state.selected_language = existing_language
                              language_changed = True
-                             logger.info(f"App language sync to '{existing_language}' from existing profile '{profile['name']}' (via New button).")
+                             logger.info("App language sync to '%s' from existing profile '%s' (via New button).", existing_language, profile['name'])
                          elif existing_language not in translations:
-                              logger.warning(f"Existing profile '{profile['name']}' invalid lang '{existing_language}', keeping app lang {st.session_state.selected_language}.")
+                              logger.warning("Existing profile '%s' invalid lang '%s', keeping app lang %s.", profile['name'], existing_language, st.session_state.selected_language)
 
                          loaded_lat = profile.get('latitude', PROFILE_DEFAULT_LAT); loaded_lon = profile.get('longitude', PROFILE_DEFAULT_LON)
                          if loaded_lat != 0.0 or loaded_lon != 0.0: st.session_state.map_center = [loaded_lat, loaded_lon]; st.session_state.map_zoom = MAP_CLICK_ZOOM
@@ -1650,7 +1883,7 @@ def main():
                          for key in ['_form_lat_default','_form_lon_default','_form_soil_default','_form_size_default','_form_lang_default']:
                              if key in st.session_state: del st.session_state[key]
 
-                         logger.info(f"Existing profile '{profile['name']}' loaded instead of creating new. Rerun (Lang changed: {language_changed}).")
+                         logger.info("Existing profile '%s' loaded instead of creating new. Rerun (Lang changed: %s).", profile['name'], language_changed)
                          st.rerun()
                      else:
                          st.info(ui_translator("creating_profile_info", name=current_entered_name))
@@ -1672,7 +1905,7 @@ def main():
                          else:
                              st.session_state.map_center = [MAP_DEFAULT_LAT, MAP_DEFAULT_LON]; st.session_state.map_zoom = 5
 
-                         logger.info(f"Showing new profile form for '{current_entered_name}'. Rerun.")
+                         logger.info("Showing new profile form for '%s'. Rerun.", current_entered_name)
                          st.rerun()
         st.divider()
 
@@ -1719,7 +1952,7 @@ def main():
                         logger.error("New profile form submitted but form_trigger_name was missing.")
                     else:
                         new_profile_data = { 'name': profile_name_to_save, 'language': st.session_state.form_new_lang, 'latitude': st.session_state.form_new_lat, 'longitude': st.session_state.form_new_lon, 'soil_type': st.session_state.form_new_soil, 'farm_size_ha': st.session_state.form_new_size }
-                        logger.info(f"Attempting to save new profile for '{profile_name_to_save}'. Data: {new_profile_data}")
+                        logger.info("Attempting to save new profile for '%s'. Data: %s", profile_name_to_save, new_profile_data)
 
                         current_db_state = load_or_create_farmer_db()
                         updated_db = add_or_update_farmer(current_db_state, new_profile_data)
@@ -1738,9 +1971,9 @@ def main():
                                 if saved_language in translations and st.session_state.selected_language != saved_language:
                                      st.session_state.selected_language = saved_language
                                      lang_changed_on_save = True
-                                     logger.info(f"App language sync to '{saved_language}' from saved profile: {profile_name_to_save}.")
+                                     logger.info("App language sync to '%s' from saved profile: %s.", saved_language, profile_name_to_save)
                                 elif saved_language not in translations:
-                                     logger.warning(f"Saved profile '{profile_name_to_save}' invalid lang '{saved_language}', keeping app lang {st.session_state.selected_language}.")
+                                     logger.warning("Saved profile '%s' invalid lang '%s', keeping app lang %s.", profile_name_to_save, saved_language, st.session_state.selected_language)
 
                                 saved_lat = saved_profile.get('latitude', PROFILE_DEFAULT_LAT); saved_lon = saved_profile.get('longitude', PROFILE_DEFAULT_LON)
                                 if saved_lat != 0.0 or saved_lon != 0.0: st.session_state.map_center = [saved_lat, saved_lon]; st.session_state.map_zoom = MAP_CLICK_ZOOM
@@ -1751,16 +1984,16 @@ def main():
                                      if key in st.session_state: del st.session_state[key]
 
                                 st.success(ui_translator("profile_saved_success", name=profile_name_to_save))
-                                logger.info(f"New profile saved for '{profile_name_to_save}'. Rerun (Lang changed: {lang_changed_on_save}).")
+                                logger.info("New profile saved for '%s'. Rerun (Lang changed: %s).", profile_name_to_save, lang_changed_on_save)
                                 st.rerun()
                             else:
-                                logger.error(f"Profile '{profile_name_to_save}' not found immediately after saving.")
+                                logger.error("Profile '%s' not found immediately after saving.", profile_name_to_save)
                                 st.error(ui_translator("profile_reload_error_after_save"))
                                 st.session_state.show_new_profile_form = False
                                 st.session_state.form_trigger_name = None
                                 st.rerun()
                         else:
-                            logger.error(f"Failed to get updated DataFrame saving profile '{profile_name_to_save}'.")
+                            logger.error("Failed to get updated DataFrame saving profile '%s'.", profile_name_to_save)
                             st.error(ui_translator("db_update_error_on_save"))
 
         active_profile = st.session_state.current_farmer_profile
@@ -1811,6 +2044,11 @@ def main():
     else:
         farmer_name = st.session_state.current_farmer_profile.get('name', ui_translator("unknown_farmer"))
         profile_language = st.session_state.current_farmer_profile.get('language', "English")
+        prefetch_weather_forecast(
+            st.session_state.current_farmer_profile.get('latitude', PROFILE_DEFAULT_LAT),
+            st.session_state.current_farmer_profile.get('longitude', PROFILE_DEFAULT_LON),
+            st.session_state.get("widget_weather_key_input", "").strip()
+        )
 
         tab_chat_label = ui_translator("tab_new_chat")
         tab_history_label = ui_translator("tab_past_interactions")
@@ -1842,14 +2080,14 @@ def main():
                                             st.warning(ui_translator("tts_error_generation", err="Generation failed"))
                                     except Exception as e:
                                         st.error(ui_translator("tts_error_generation", err=str(e)))
-                                        logger.error(f"TTS Button Click Error: {e}", exc_info=True)
+                                        logger.error("TTS Button Click Error: %s", e, exc_info=True)
                             else:
                                 st.caption(f"({ui_translator('tts_error_unsupported_lang', lang=profile_language)})")
                         else:
                             st.caption(f"({ui_translator('tts_error_library_missing')})")
 
             if prompt := st.chat_input(ui_translator("query_label"), key="main_chat_input_widget"):
-                logger.info(f"User query: '{prompt}'")
+                logger.info("User query: '%s'", prompt)
                 st.session_state.chat_history.append(HumanMessage(content=prompt))
 
                 gemini_key_present = bool(st.session_state.get("widget_gemini_key_input", "").strip())
@@ -1877,7 +2115,7 @@ def main():
                                     output_language=output_lang
                                 )
                                 response_text = result.get('response_text', ui_translator("processing_error", e="Empty response."))
-                                logger.info(f"AI Response status: {result.get('status', 'unknown')}. Length: {len(response_text)}")
+                                logger.info("AI Response status: %s. Length: %s", result.get('status', 'unknown'), len(response_text))
 
                                 st.session_state.chat_history.append(AIMessage(content=response_text))
 
@@ -1939,7 +2177,7 @@ def main():
                               logger.error("Edit form submitted but current profile name was missing.")
                          else:
                              updated_data = { 'name': profile_name_to_update, 'language': st.session_state.edit_form_lang, 'latitude': st.session_state.edit_form_lat, 'longitude': st.session_state.edit_form_lon, 'soil_type': st.session_state.edit_form_soil, 'farm_size_ha': st.session_state.edit_form_size }
-                             logger.info(f"Attempting to update profile for '{profile_name_to_update}'. Data: {updated_data}")
+                             logger.info("Attempting to update profile for '%s'. Data: %s", profile_name_to_update, updated_data)
 
                              current_db_state_edit = load_or_create_farmer_db()
                              updated_db_edit = add_or_update_farmer(current_db_state_edit, updated_data)
@@ -1950,7 +2188,7 @@ def main():
                                  if reloaded_profile:
                                      st.session_state.current_farmer_profile = reloaded_profile
                                      st.success(ui_translator("profile_updated_success", name=profile_name_to_update))
-                                     logger.info(f"Profile updated successfully for '{profile_name_to_update}'.")
+                                     logger.info("Profile updated successfully for '%s'.", profile_name_to_update)
 
                                      new_language_pref = reloaded_profile.get('language', 'English')
                                      lang_changed_on_edit = False
@@ -1958,22 +2196,22 @@ def main():
                                          if new_language_pref in translations:
                                              st.session_state.selected_language = new_language_pref
                                              lang_changed_on_edit = True
-                                             logger.info(f"App language sync to '{new_language_pref}' after profile edit for {profile_name_to_update}.")
+                                             logger.info("App language sync to '%s' after profile edit for %s.", new_language_pref, profile_name_to_update)
                                          else:
-                                              logger.warning(f"Edited profile '{profile_name_to_update}' invalid lang '{new_language_pref}', keeping site lang {st.session_state.selected_language}.")
+                                              logger.warning("Edited profile '%s' invalid lang '%s', keeping site lang %s.", profile_name_to_update, new_language_pref, st.session_state.selected_language)
 
                                      new_lat = reloaded_profile.get('latitude', PROFILE_DEFAULT_LAT); new_lon = reloaded_profile.get('longitude', PROFILE_DEFAULT_LON)
                                      if new_lat != 0.0 or new_lon != 0.0: st.session_state.map_center = [new_lat, new_lon]; st.session_state.map_zoom = MAP_CLICK_ZOOM
                                      else: st.session_state.map_center = [MAP_DEFAULT_LAT, MAP_DEFAULT_LON]; st.session_state.map_zoom = 5
 
-                                     logger.info(f"Rerun after profile edit. Lang changed: {lang_changed_on_edit}")
+                                     logger.info("Rerun after profile edit. Lang changed: %s", lang_changed_on_edit)
                                      st.rerun()
                                  else:
-                                     logger.error(f"Profile '{profile_name_to_update}' not found immediately after updating.")
+                                     logger.error("Profile '%s' not found immediately after updating.", profile_name_to_update)
                                      st.error(ui_translator("profile_reload_error_after_save") + " (Update)")
                                      st.rerun()
                              else:
-                                logger.error(f"Failed to get updated DataFrame when updating profile '{profile_name_to_update}'.")
+                                logger.error("Failed to get updated DataFrame when updating profile '%s'.", profile_name_to_update)
                                 st.error(ui_translator("db_update_error_on_save") + " (Update)")
 
 
@@ -1983,7 +2221,7 @@ if __name__ == "__main__":
     if data_dir and data_dir != "." and not os.path.exists(data_dir):
         try:
              os.makedirs(data_dir)
-             logger.info(f"Created data directory: {data_dir}")
+             logger.info("Created data directory: %s", data_dir)
         except OSError as e:
-             logger.error(f"Could not create data directory {data_dir}: {e}")
+             logger.error("Could not create data directory %s: %s", data_dir, e)
     main()
\ No newline at end of file